@@ -0,0 +1,112 @@
+### Path and pixel helpers shared by the converter versions.
+### Pure Python, fully annotated so it can be compiled with mypyc (see setup.py); the
+### converters import it the same way whether or not the compiled extension is present.
+
+import os
+from typing import Dict, List, Sequence
+from urllib.parse import quote
+import numpy as np
+from PIL import Image
+
+# Numba-compiled alpha compositing (kernels.py); the numpy version is used otherwise
+try:
+    from kernels import alpha_over_white
+    HAS_NUMBA = True
+except Exception:
+    HAS_NUMBA = False
+
+
+def path_to_file_uri(p: str) -> str:
+    """Convert Windows paths (drive or UNC) to file:// URI."""
+    # Single string pass; the dialog already hands back absolute paths, so skip abspath/getcwd
+    p_abs = (p if os.path.isabs(p) else os.path.abspath(p)).replace("\\", "/")
+    if p_abs.startswith("//"):  # UNC
+        return "file:" + quote(p_abs)
+    if p_abs[1:2] == ":":  # drive letter stays unquoted, as in Path.as_uri
+        return "file:///" + p_abs[:2] + quote(p_abs[2:])
+    return "file://" + quote(p_abs)
+
+
+def _basename_no_ext(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+# str.translate table: keeps alphanumerics and "._- ", maps everything else to "_". Filled per code
+# point on first sight (a dict subclass with __missing__ would not compile under mypyc), so
+# non-ASCII letters still follow str.isalnum().
+_SAFE_NAME_TABLE: Dict[int, int] = {}
+
+
+def _safe_name(base: str) -> str:
+    table = _SAFE_NAME_TABLE
+    for ch in set(base):
+        code = ord(ch)
+        if code not in table:
+            table[code] = code if ch.isalnum() or ch in "._- " else ord("_")
+    return base.translate(table)
+
+
+def _ensure_rgb_np(arr: np.ndarray) -> np.ndarray:
+    # Alpha-composite an (H, W, 2|4) uint8 LA/RGBA array onto white; returns (H, W, 3) uint8
+    out = np.empty(arr.shape[:2] + (3,), dtype=np.uint8)
+    if HAS_NUMBA:
+        alpha_over_white(np.ascontiguousarray(arr), out)
+        return out
+    color, alpha = (arr[..., :1], arr[..., 1:]) if arr.shape[2] == 2 else (arr[..., :3], arr[..., 3:])
+    # Work in row blocks so the uint16 temporaries stay small on huge images
+    for y in range(0, arr.shape[0], 1024):
+        c = color[y:y + 1024].astype(np.uint16)
+        a = alpha[y:y + 1024].astype(np.uint16)
+        out[y:y + 1024] = (c * a + 255 * (255 - a) + 127) // 255
+    return out
+
+
+def _ensure_rgb(img: Image.Image) -> Image.Image:
+    if img.mode in ("RGBA", "LA"):
+        return Image.fromarray(_ensure_rgb_np(np.asarray(img)))
+    if img.mode != "RGB":
+        return img.convert("RGB")
+    return img
+
+
+def _is_unc(p: str) -> bool:
+    try:
+        return os.path.abspath(p).startswith("\\\\")
+    except Exception:
+        return False
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _largest_first(files: Sequence[str]) -> List[str]:
+    # Longest-processing-time order: big files start first and small ones backfill idle workers,
+    # instead of one giant TIFF starting last and running alone at the tail
+    return sorted(files, key=_file_size, reverse=True)
+
+
+def _max_workers(files: Sequence[str], out_dir: str) -> int:
+    """
+    Ceiling for _auto_workers, independent of the batch size (used to size long-lived pools):
+    - If any input/output is UNC (network share): 1 worker
+    - Else: all CPU cores but one (left for the UI)
+    """
+    if _is_unc(out_dir) or any(_is_unc(f) for f in files):
+        return 1
+    # The decode/encode/resize work releases the GIL (or runs in processes), so use every core
+    # but one, which is left for the Tk thread
+    cores = os.cpu_count() or 4
+    return max(1, cores - 1)
+
+
+def _auto_workers(files: Sequence[str], out_dir: str) -> int:
+    """
+    Auto-choose worker count: _max_workers, capped by number of files, min 1
+    """
+    if not files:
+        return 1
+    return min(len(files), _max_workers(files, out_dir))
@@ -3,15 +3,17 @@
 import os
 import sys
 import time
+import threading
+import queue
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-from pathlib import Path
-from urllib.parse import quote
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from PIL import Image
+from PIL import Image, ImageFile
+from converter_core import path_to_file_uri, _auto_workers, _basename_no_ext, _ensure_rgb, _largest_first, _safe_name
 
 # Trust very large images
 Image.MAX_IMAGE_PIXELS = 50_000_000_000  # or None for unlimited
+ImageFile.LOAD_TRUNCATED_IMAGES = True  # Allow broken TIFFs
 
 # DeepZoom backend
 try:
@@ -32,82 +34,71 @@ output_dir = tk.StringVar(value="")
 status_jpeg = tk.StringVar(value="")
 status_dz = tk.StringVar(value="")
 elapsed_total = tk.StringVar(value="")
+small_jpeg = tk.BooleanVar(value=False)  # optimized progressive encode: smaller, ~2x slower
 
 # progress
 progress_var = tk.IntVar(value=0)
 progress_max = tk.IntVar(value=100)
 
+# Worker threads never touch Tk directly; they queue progress and _pump_ui applies it on the Tk thread
+progress_q = queue.Queue()
+UI_PUMP_MS = 50
+
+# Long-lived threads for the button handlers instead of a new executor per click
+_UI_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ui-task")
+
 # ===== Console Redirect =====
 class ConsoleRedirect:
+    # write() may be called from any thread; only drain() (on the Tk thread) touches the widget,
+    # batching everything queued since the last tick into one insert
     def __init__(self, text_widget):
         self.text_widget = text_widget
         self.text_widget.configure(state='disabled')
+        self.buf_q = queue.SimpleQueue()
+        self._pump()
     def write(self, message):
-        self.text_widget.configure(state='normal')
-        self.text_widget.insert(tk.END, message)
-        self.text_widget.see(tk.END)
-        self.text_widget.configure(state='disabled')
+        self.buf_q.put(message)
+    def drain(self):
+        chunks = []
+        while True:
+            try:
+                chunks.append(self.buf_q.get_nowait())
+            except queue.Empty:
+                break
+        if chunks:
+            self.text_widget.configure(state='normal')
+            self.text_widget.insert(tk.END, "".join(chunks))
+            self.text_widget.see(tk.END)
+            self.text_widget.configure(state='disabled')
+    def _pump(self):
+        self.drain()
+        self.text_widget.after(UI_PUMP_MS, self._pump)
     def flush(self):
         pass
 
 # ===== Helpers =====
-def path_to_file_uri(p: str) -> str:
-    """Convert Windows paths (drive or UNC) to file:// URI."""
-    p_abs = os.path.abspath(p)
-    if p_abs.startswith("\\\\"):  # UNC
-        without_leading = p_abs[2:].replace("\\", "/")
-        return "file://" + quote(without_leading)
-    return Path(p_abs).as_uri()
-
-def _basename_no_ext(path):
-    return os.path.splitext(os.path.basename(path))[0]
-
 def _summarize_file_selection(files):
     if not files:
         return ""
     return files[0] if len(files) == 1 else f"{len(files)} files selected (first: {files[0]})"
 
-def _ensure_rgb(img: Image.Image) -> Image.Image:
-    if img.mode in ("RGBA", "LA"):
-        bg = Image.new("RGB", img.size, (255, 255, 255))
-        bg.paste(img, mask=img.split()[-1])
-        return bg
-    if img.mode == "P":
-        return img.convert("RGB")
-    if img.mode != "RGB":
-        return img.convert("RGB")
-    return img
+def _pump_ui():
+    latest = None
+    while True:
+        try:
+            latest = progress_q.get_nowait()
+        except queue.Empty:
+            break
+    if latest is not None:
+        progress_var.set(latest)
+
+    root.after(UI_PUMP_MS, _pump_ui)
 
 def _set_busy(busy: bool):
     for child in root.winfo_children():
         if isinstance(child, tk.Button):
             child.config(state="disabled" if busy else "normal")
 
-def _is_unc(p: str) -> bool:
-    try:
-        return os.path.abspath(p).startswith("\\\\")
-    except Exception:
-        return False
-
-def _auto_workers(files, out_dir) -> int:
-    """
-    Auto-choose worker count:
-    - If any input/output is UNC (network share): 1 worker
-    - Else: half of CPU cores, capped by number of files, min 1
-    """
-    if not files:
-        return 1
-    if _is_unc(out_dir) or any(_is_unc(f) for f in files):
-        w = 1
-    else:
-        cores = os.cpu_count() or 4
-        w = max(1, cores // 2)
-        w = min(w, len(files))
-    print(f"[Auto Workers] Using {w} worker(s) "
-          f"(UNC={'Yes' if (_is_unc(out_dir) or any(_is_unc(f) for f in files)) else 'No'}, "
-          f"CPU={os.cpu_count()})")
-    return w
-
 # ===== File pickers =====
 def choose_input():
     global input_files
@@ -131,69 +122,83 @@ def choose_output():
         print(f"[Choose Output] Selected folder: {folder}\n")
 
 # ===== JPEG conversion =====
+def _jpeg_convert_one(src, outdir, small_files=False):
+    """Convert a single file to JPEG; returns (status, src, seconds, out_path or message)."""
+    if not os.path.exists(src):
+        return ("skip", src, 0.0, "not found")
+    try:
+        base = _basename_no_ext(src).rstrip(". ")
+
+        # Sanitize base to remove bad characters
+        safe = _safe_name(base)
+        out_path = os.path.join(outdir, f"{safe}.jpg")
+
+        start = time.perf_counter()
+        with Image.open(src) as im:
+            try:
+                im.seek(0)  # Handle multi-page TIFFs
+            except Exception:
+                pass
+
+            im = _ensure_rgb(im)
+
+            # Baseline by default; optimized Huffman + progressive only when asked for
+            extra = {"optimize": True, "progressive": True} if small_files else {}
+            im.save(out_path, "JPEG", quality=95, subsampling=0, **extra)
+        return ("ok", src, time.perf_counter() - start, out_path)
+    except Exception as e:
+        return ("err", src, 0.0, repr(e))
+
 def save_jpeg():
     if not input_files or not output_dir.get():
         messagebox.showerror("Missing input", "Select input image(s) and an output folder first.")
         return
 
-    os.makedirs(output_dir.get(), exist_ok=True)
+    out_abs = os.path.abspath(output_dir.get())
+    os.makedirs(out_abs, exist_ok=True)
     total = len(input_files)
     progress_max.set(total)
     progress_var.set(0)
     elapsed_total.set("")
     _set_busy(True)
+    small_files = small_jpeg.get()
+
+    workers = _auto_workers(input_files, out_abs)
 
     def worker():
         t0 = time.perf_counter()
         converted = 0
         errors = 0
-        for i, src in enumerate(input_files, 1):
-            t_file = time.perf_counter()
-            try:
-                if not os.path.exists(src):
-                    print(f"[Save JPEG] Skipped (not found): {src}")
-                    errors += 1
-                else:
-                    base = _basename_no_ext(src).rstrip(". ")
-
-                    # Sanitize base to remove bad characters
-                    safe = "".join(c if c.isalnum() or c in "._- " else "_" for c in base)
-                    out_path = os.path.join(output_dir.get(), f"{safe}.jpg")
-
-                    print("[DEBUG] Saving:", out_path)
-
-                    from PIL import ImageFile
-                    ImageFile.LOAD_TRUNCATED_IMAGES = True  # Allow broken TIFFs
-
-                    with Image.open(src) as im:
-                        try:
-                            im.seek(0)  # Handle multi-page TIFFs
-                        except Exception:
-                            pass
-
-                        im = _ensure_rgb(im)
-
-                        im.save(out_path, "JPEG",
-                                quality=95, optimize=True,
-                                progressive=True, subsampling=0)
+        print(f"[Save JPEG] Mode: {'smaller files' if small_files else 'fast'}")
+        print(f"[Save JPEG] Workers (auto): {workers}\n")
 
+        # PIL releases the GIL while decoding/encoding, so files convert in parallel
+        done_count = 0
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [ex.submit(_jpeg_convert_one, src, out_abs, small_files) for src in _largest_first(input_files)]
+            for fut in as_completed(futures):
+                status, src, dt, info = fut.result()
+                done_count += 1
+                if status == "ok":
                     converted += 1
-                    dt = time.perf_counter() - t_file
-                    print(f"[Save JPEG] Saved: {out_path}  ({dt:.2f}s)")
-            except Exception as e:
-                errors += 1
-                print(f"[Save JPEG] Error converting {src}: {repr(e)}")
-            root.after(0, lambda val=i: progress_var.set(val))
+                    print(f"[Save JPEG] Saved: {info}  ({dt:.2f}s)")
+                elif status == "skip":
+                    errors += 1
+                    print(f"[Save JPEG] Skipped (not found): {src}")
+                else:
+                    errors += 1
+                    print(f"[Save JPEG] Error converting {src}: {info}")
+                progress_q.put(done_count)
 
         dt_total = time.perf_counter() - t0
         print(f"\n[Save JPEG] Done. Converted: {converted}, Errors: {errors}, Elapsed: {dt_total:.2f}s\n")
-        status_jpeg.set(f"Saved {converted} JPEG(s)")
+        root.after(0, lambda: status_jpeg.set(f"Saved {converted} JPEG(s)"))
         root.after(0, lambda: elapsed_total.set(f"Last run elapsed: {dt_total:.2f}s"))
         root.after(0, lambda: _set_busy(False))
         root.after(0, lambda: messagebox.showinfo("Done",
                     f"Converted {converted} file(s) to JPEG.\nErrors: {errors}\nElapsed: {dt_total:.2f}s"))
 
-    ThreadPoolExecutor(max_workers=1).submit(worker)
+    _UI_EXEC.submit(worker)
 
 
 
@@ -238,7 +243,8 @@ def create_deepzoom():
         messagebox.showerror("Missing input", "Select input image(s) and an output folder first.")
         return
 
-    os.makedirs(output_dir.get(), exist_ok=True)
+    out_abs = os.path.abspath(output_dir.get())
+    os.makedirs(out_abs, exist_ok=True)
 
     # progress 
     total = len(input_files)
@@ -248,7 +254,7 @@ def create_deepzoom():
     _set_busy(True)
 
 
-    workers = _auto_workers(input_files, output_dir.get())
+    workers = _auto_workers(input_files, out_abs)
 
     def run_parallel():
         t0 = time.perf_counter()
@@ -260,16 +266,22 @@ def create_deepzoom():
         print(f"[DeepZoom] Workers (auto): {workers}\n")
 
         
+        # ImageCreator keeps per-call state (image, descriptor), so build one per worker thread
+        # and reuse it for every file that thread handles, instead of one per file
+        local = threading.local()
+
         def job(src):
             try:
-                creator = _dz_make_creator()
-                return _dz_convert_one(src, output_dir.get(), creator)
+                creator = getattr(local, "creator", None)
+                if creator is None:
+                    creator = local.creator = _dz_make_creator()
+                return _dz_convert_one(src, out_abs, creator)
             except Exception as e:
                 return ("err", src, 0.0, str(e))
 
         done_count = 0
         with ThreadPoolExecutor(max_workers=workers) as ex:
-            futures = [ex.submit(job, src) for src in input_files]
+            futures = [ex.submit(job, src) for src in _largest_first(input_files)]
             for fut in as_completed(futures):
                 status, src, dt, info = fut.result()
                 done_count += 1
@@ -282,12 +294,12 @@ def create_deepzoom():
                 else:
                     errors += 1
                     print(f"[DeepZoom] Error: {src}\n  -> {info}")
-                root.after(0, lambda val=done_count: progress_var.set(val))
+                progress_q.put(done_count)
 
         dt_total = time.perf_counter() - t0
         print(f"\n[DeepZoom] Done. Created: {created}, Skipped: {skipped}, Errors: {errors}, "
               f"Elapsed: {dt_total:.2f}s\n")
-        status_dz.set(f"Created {created} DZI(s)")
+        root.after(0, lambda: status_dz.set(f"Created {created} DZI(s)"))
         root.after(0, lambda: elapsed_total.set(f"Last run elapsed: {dt_total:.2f}s"))
         root.after(0, lambda: _set_busy(False))
         root.after(0, lambda: messagebox.showinfo(
@@ -295,7 +307,7 @@ def create_deepzoom():
             f"Created: {created}\nSkipped: {skipped}\nErrors: {errors}\nElapsed: {dt_total:.2f}s"
         ))
 
-    ThreadPoolExecutor(max_workers=1).submit(run_parallel)
+    _UI_EXEC.submit(run_parallel)
 
 # ===== Layout =====
 row = 0
@@ -317,6 +329,10 @@ lbl_jpeg_text = tk.Label(root, text="Converts .tif to jpeg, for use with SEM", a
 lbl_jpeg_text.grid(row=row, column=1, padx=8, pady=10, sticky="w")
 row += 1
 
+chk_small = tk.Checkbutton(root, text="Smaller files (slower)", variable=small_jpeg, anchor="w")
+chk_small.grid(row=row, column=1, padx=8, pady=0, sticky="w")
+row += 1
+
 btn_dz = tk.Button(root, text="Create DeepZoom (.dzi) for Selection", command=create_deepzoom)
 btn_dz.grid(row=row, column=0, padx=8, pady=10, sticky="ew")
 lbl_dz_text = tk.Label(root, text="Creates .dzi from a .jpg.", anchor="w")
@@ -370,4 +386,7 @@ eoleson (at) uark (dot) edu.
 === DeepZoom Converter Ready ===
 """)
 
-root.mainloop()
\ No newline at end of file
+_pump_ui()
+root.mainloop()
+# Window closed: drop queued work now; an atexit hook would only run after it had all finished
+_UI_EXEC.shutdown(wait=False, cancel_futures=True)
\ No newline at end of file
@@ -5,38 +5,89 @@ import sys
 import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
-from pathlib import Path
-from urllib.parse import quote
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import threading
+from functools import partial
+import PIL
+from PIL import Image, ImageFile, features
+import numpy as np
 import datetime
 import io
+import queue
+import shutil
+from converter_core import (_auto_workers, _basename_no_ext, _ensure_rgb, _ensure_rgb_np, _is_unc, _largest_first,
+                            _max_workers, _safe_name)
 
 # Trust very large images
 Image.MAX_IMAGE_PIXELS = 50_000_000_000
+ImageFile.LOAD_TRUNCATED_IMAGES = True  # Allow broken TIFFs
 
 # DeepZoom backend
 try:
     from deepzoom import ImageCreator
+    from fast_deepzoom import FastImageCreator
     HAS_DEEPZOOM = True
 except Exception:
     HAS_DEEPZOOM = False
 
-root = tk.Tk()
-root.title("DeepZoom Image Converter")
-root.geometry("960x640")
+# Fast TIFF decode (memory-mapped, GIL released); PIL is used otherwise
+try:
+    import tifffile
+    HAS_TIFFFILE = True
+except Exception:
+    HAS_TIFFFILE = False
 
-input_files = []
-input_summary = tk.StringVar()
-output_dir = tk.StringVar()
-status_jpeg = tk.StringVar()
-status_dz = tk.StringVar()
-elapsed_total = tk.StringVar()
-progress_var = tk.IntVar()
-progress_max = tk.IntVar(value=100)
+# Direct libjpeg-turbo encode for the .tif -> .jpg path
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_444, TJFLAG_PROGRESSIVE
+    _TJ = TurboJPEG()
+    HAS_TURBOJPEG = True
+except Exception:
+    HAS_TURBOJPEG = False
 
 log_file_stream = io.StringIO()
 
+# Worker threads never touch Tk directly; they queue updates that are applied on the Tk thread
+progress_q = queue.Queue()
+UI_PUMP_MS = 50
+
+# Long-lived executors: button clicks reuse these threads/processes instead of building new ones
+_UI_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ui-task")
+_POOLS = {}  # kind -> (executor, workers)
+_POOLS_LOCK = threading.Lock()  # both _UI_EXEC threads can fetch/drop pools
+# Pools are sized with _max_workers rather than per batch, so a different number of files does not
+# respawn the DeepZoom processes; only a UNC/local switch changes the size
+
+def _get_pool(kind, workers):
+    with _POOLS_LOCK:
+        pool, size = _POOLS.get(kind, (None, None))
+        if pool is None or size != workers:
+            if pool is not None:
+                pool.shutdown(wait=False)
+            if kind == "dz":
+                pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                           initializer=_dz_init_worker)
+            else:
+                pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=kind)
+            _POOLS[kind] = (pool, workers)
+        return pool
+
+def _drop_pool(kind, pool):
+    # Only drop the pool that broke; another run may already have replaced it
+    with _POOLS_LOCK:
+        if _POOLS.get(kind, (None, None))[0] is pool:
+            del _POOLS[kind]
+    pool.shutdown(wait=False)
+
+def _shutdown_pools():
+    _UI_EXEC.shutdown(wait=False, cancel_futures=True)
+    with _POOLS_LOCK:
+        for pool, _ in _POOLS.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+
+
 def get_log_file_path():
     folder = output_dir.get()
     if not folder:
@@ -45,54 +96,148 @@ def get_log_file_path():
     return os.path.join(folder, f"converter_log_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
 
 class ConsoleRedirect:
+    # write() may be called from any thread; only drain() (on the Tk thread) touches the widget
+    # and the log stream, batching everything queued since the last tick into one insert.
     def __init__(self, text_widget):
         self.text_widget = text_widget
         self.text_widget.configure(state='disabled')
         self.suspend_logging = False  # New flag
+        self.buf_q = queue.SimpleQueue()
+        self._pump()
 
     def write(self, message):
-        self.text_widget.configure(state='normal')
-        self.text_widget.insert(tk.END, message)
-        self.text_widget.see(tk.END)
-        self.text_widget.configure(state='disabled')
-        if not self.suspend_logging:
-            log_file_stream.write(message)
+        self.buf_q.put((message, self.suspend_logging))
+
+    def drain(self):
+        chunks = []
+        while True:
+            try:
+                message, suspended = self.buf_q.get_nowait()
+            except queue.Empty:
+                break
+            chunks.append(message)
+            if not suspended:
+                log_file_stream.write(message)
+        if chunks:
+            self.text_widget.configure(state='normal')
+            self.text_widget.insert(tk.END, "".join(chunks))
+            self.text_widget.see(tk.END)
+            self.text_widget.configure(state='disabled')
+
+    def _pump(self):
+        self.drain()
+        self.text_widget.after(UI_PUMP_MS, self._pump)
 
     def flush(self):
         pass
 
+def _save_log():
+    # Tk thread, after a batch: pull in any console text still queued before writing the file
+    redir.drain()
+    with open(get_log_file_path(), "w", encoding="utf-8") as f:
+        f.write(log_file_stream.getvalue())
+
+def _pump_ui():
+    latest = None
+    while True:
+        try:
+            latest = progress_q.get_nowait()
+        except queue.Empty:
+            break
+    if latest is not None:
+        progress_var.set(latest)
+
+    root.after(UI_PUMP_MS, _pump_ui)
+
 # === Helpers ===
-def path_to_file_uri(p: str) -> str:
-    p_abs = os.path.abspath(p)
-    if p_abs.startswith("\\\\"):
-        return "file://" + quote(p_abs[2:].replace("\\", "/"))
-    return Path(p_abs).as_uri()
-
-def _basename_no_ext(path):
-    return os.path.splitext(os.path.basename(path))[0]
-
-def _ensure_rgb(img: Image.Image) -> Image.Image:
-    if img.mode in ("RGBA", "LA"):
-        bg = Image.new("RGB", img.size, (255, 255, 255))
-        bg.paste(img, mask=img.split()[-1])
-        return bg
-    if img.mode == "P" or img.mode != "RGB":
-        return img.convert("RGB")
-    return img
-
-def _is_unc(p: str) -> bool:
-    try:
-        return os.path.abspath(p).startswith("\\\\")
-    except:
+def _is_tiff(path):
+    return path.lower().endswith((".tif", ".tiff"))
+
+def _seek_largest_frame(im):
+    # Multi-page TIFFs (e.g. SEM exports) can carry a thumbnail next to the full-resolution frame
+    n = getattr(im, "n_frames", 1)
+    if n > 1:
+        areas = []
+        for i in range(n):
+            im.seek(i)
+            areas.append(im.size[0] * im.size[1])
+        im.seek(max(range(n), key=areas.__getitem__))
+
+def _read_tiff(src):
+    # Decodes the largest page into a temp-file-backed memmap, so pixels go through the page cache instead
+    # of the heap. Returns a (H, W) gray or (H, W, 3) RGB uint8 array, or None for layouts PIL should handle.
+    with tifffile.TiffFile(src) as tif:
+        page = tif.pages[0]
+        if len(tif.pages) > 1:
+            page = max(tif.pages, key=lambda p: p.imagewidth * p.imagelength)
+        if (page.dtype != np.uint8
+                or page.photometric not in (tifffile.PHOTOMETRIC.MINISBLACK, tifffile.PHOTOMETRIC.RGB)
+                or (page.samplesperpixel > 1 and page.planarconfig != tifffile.PLANARCONFIG.CONTIG)):
+            return None
+        try:
+            arr = page.asarray(out="memmap")
+        except Exception:
+            # e.g. LZW/JPEG-compressed pages when imagecodecs is missing; PIL decodes those itself
+            return None
+    if arr.ndim == 3 and arr.shape[2] in (2, 4):
+        return _ensure_rgb_np(arr)
+    if arr.ndim == 2 or (arr.ndim == 3 and arr.shape[2] == 3):
+        return arr
+    return None
+
+def _print_codec_info():
+    # Pillow-SIMD reports a ".postN" version; libjpeg-turbo drives the JPEG decode/encode speed
+    turbo = features.check_feature("libjpeg_turbo")
+    print(f"[PIL] Pillow {PIL.__version__}, libjpeg-turbo: {'Yes' if turbo else 'No'}\n")
+
+def _tiff_to_jpeg_fast(src, out_path, small_files=False) -> bool:
+    arr = _read_tiff(src)
+    if arr is None:
         return False
-
-def _auto_workers(files, out_dir):
-    if not files:
-        return 1
-    if _is_unc(out_dir) or any(_is_unc(f) for f in files):
-        return 1
-    cores = os.cpu_count() or 4
-    return max(1, min(len(files), cores // 2))
+    if not HAS_TURBOJPEG:
+        extra = {"optimize": True, "progressive": True} if small_files else {}
+        Image.fromarray(arr).convert("RGB").save(out_path, "JPEG", quality=95, subsampling=0, **extra)
+        return True
+    if arr.ndim == 2:
+        arr = np.repeat(arr[:, :, None], 3, axis=2)
+    data = _TJ.encode(np.ascontiguousarray(arr), quality=95, pixel_format=TJPF_RGB,
+                      jpeg_subsample=TJSAMP_444, flags=TJFLAG_PROGRESSIVE if small_files else 0)
+    with open(out_path, "wb") as f:
+        f.write(data)
+    return True
+
+def _write_jpeg(src, out_path, small_files=False):
+    # Baseline q=95 4:4:4 by default; the optimized-Huffman progressive encode is ~5-10% smaller
+    # but roughly doubles encode time, so it is opt-in via the "Smaller files" checkbox
+    if HAS_TIFFFILE and _is_tiff(src):
+        if _tiff_to_jpeg_fast(src, out_path, small_files):
+            return
+    with Image.open(src) as im:
+        _seek_largest_frame(im)
+        im = _ensure_rgb(im)
+        extra = {"optimize": True, "progressive": True} if small_files else {}
+        im.save(out_path, "JPEG", quality=95, subsampling=0, **extra)
+
+def _jpeg_convert_one(src, outdir, small_files=False, reencode_jpeg=False):
+    if not os.path.exists(src):
+        return ("skip", src, 0.0, "not found")
+    try:
+        base = _basename_no_ext(src).rstrip(". ")
+        safe = _safe_name(base)
+        out_path = os.path.join(outdir, f"{safe}.jpg")
+        t0 = time.perf_counter()
+        if not reencode_jpeg and src.lower().endswith((".jpg", ".jpeg")):
+            # Already a JPEG: a byte copy is lossless and skips decode/encode (sendfile on Linux).
+            # An input already sitting in the output folder (IMG.JPG -> IMG.jpg on Windows) is left as is.
+            try:
+                shutil.copyfile(src, out_path)
+            except shutil.SameFileError:
+                pass
+        else:
+            _write_jpeg(src, out_path, small_files)
+        return ("ok", src, time.perf_counter() - t0, out_path)
+    except Exception as e:
+        return ("err", src, 0.0, str(e))
 
 # === File pickers ===
 def choose_input():
@@ -116,7 +261,8 @@ def save_jpeg():
         messagebox.showerror("Missing input", "Select image(s) and output folder first.")
         return
 
-    os.makedirs(output_dir.get(), exist_ok=True)
+    outdir = os.path.abspath(output_dir.get())
+    os.makedirs(outdir, exist_ok=True)
     progress_max.set(len(input_files))
     progress_var.set(0)
 
@@ -124,52 +270,42 @@ def save_jpeg():
 
     elapsed_total.set("")
 
-    def update_progress(val):
-        progress_var.set(val)
+    workers = _auto_workers(input_files, outdir)
+    small_files = small_jpeg.get()
+    reencode = reencode_jpeg.get()
 
     def worker():
-        from PIL import ImageFile
-        ImageFile.LOAD_TRUNCATED_IMAGES = True
         t0 = time.perf_counter()
         converted = 0
         errors = 0
 
-        for i, src in enumerate(input_files, 1):
-            try:
-                if not os.path.exists(src):
-                    print(f"[JPEG] Skipped missing: {src}")
-                    errors += 1
-                    continue
-
-                base = _basename_no_ext(src).rstrip(". ")
-                safe = "".join(c if c.isalnum() or c in "._- " else "_" for c in base)
-                out_path = os.path.join(output_dir.get(), f"{safe}.jpg")
-
-                with Image.open(src) as im:
-                    try: im.seek(0)
-                    except: pass
-                    im = _ensure_rgb(im)
-                    im.save(out_path, "JPEG", quality=95, optimize=True, progressive=True, subsampling=0)
-
-                print(f"[JPEG] Saved: {out_path}")
+        print(f"[JPEG] Workers (auto): {workers}, mode: {'smaller files' if small_files else 'fast'}")
+        done_count = 0
+        # tifffile and libjpeg-turbo release the GIL, so files decode/encode in parallel
+        ex = _get_pool("jpeg", _max_workers(input_files, outdir))
+        futures = [ex.submit(_jpeg_convert_one, src, outdir, small_files, reencode) for src in _largest_first(input_files)]
+        for fut in as_completed(futures):
+            status, src, dt, info = fut.result()
+            done_count += 1
+            if status == "ok":
                 converted += 1
-            except Exception as e:
+                print(f"[JPEG] Saved: {info} ({dt:.2f}s)")
+            elif status == "skip":
                 errors += 1
-                print(f"[JPEG] Error: {src} => {e}")
-
-    
-            root.after(0, update_progress, i)
+                print(f"[JPEG] Skipped missing: {src}")
+            else:
+                errors += 1
+                print(f"[JPEG] Error: {src} => {info}")
+            progress_q.put(done_count)
 
         dt = time.perf_counter() - t0
         print(f"[JPEG] Done. {converted} converted, {errors} errors, {dt:.2f}s elapsed\n")
 
-        # Write logs
-        with open(get_log_file_path(), "w", encoding="utf-8") as f:
-            f.write(log_file_stream.getvalue())
+        root.after(0, _save_log)
 
         root.after(0, lambda: messagebox.showinfo("tif converted to jpeg", f"Converted: {converted}\nErrors: {errors}"))
 
-    ThreadPoolExecutor(max_workers=1).submit(worker)
+    _UI_EXEC.submit(worker)
 
 
 # === DeepZoom ===
@@ -178,22 +314,52 @@ DZ_OVERLAP = 1
 DZ_IMAGE_QUALITY = 0.9
 DZ_FILTER = Image.LANCZOS
 
-def _dz_make_creator():
-    return ImageCreator(
+def _dz_make_creator(tile_workers=None):
+    return FastImageCreator(
         tile_size=DZ_TILE_SIZE,
         tile_overlap=DZ_OVERLAP,
         tile_format="jpg",
         image_quality=DZ_IMAGE_QUALITY,
-        resize_filter=DZ_FILTER
+        resize_filter=DZ_FILTER,
+        tile_workers=tile_workers
     )
 
+def _dz_open_source(src):
+    if not _is_tiff(src):
+        return src
+    arr = _read_tiff(src) if HAS_TIFFFILE else None
+    if arr is not None:
+        # Gray frames wrap the memmap without a copy, so tile crops page in only what they touch
+        return Image.fromarray(arr)
+    im = Image.open(src)
+    _seek_largest_frame(im)
+    return im
+
 def _dz_convert_one(src, outdir, creator: ImageCreator):
+    if not os.path.exists(src):
+        return ("skip", src, 0.0, "not found")
     base = _basename_no_ext(src)
-    src_uri = path_to_file_uri(src)
     dzi_path = os.path.join(outdir, f"{base}.dzi")
     t0 = time.perf_counter()
-    creator.create(src_uri, dzi_path)
-    return (src, time.perf_counter() - t0)
+    # create() opens it itself, so no frame here keeps the full-resolution image alive while it tiles
+    creator.create(partial(_dz_open_source, src), dzi_path)
+    return ("ok", src, time.perf_counter() - t0, dzi_path)
+
+_DZ_CREATOR = None
+
+def _dz_init_worker():
+    # Pool initializer: one creator per worker process, reused for every file it handles
+    global _DZ_CREATOR
+    _DZ_CREATOR = _dz_make_creator()
+
+def _dz_job(src, outdir, tile_workers):
+    # Runs in a worker process; files there are handled one at a time, so sharing _DZ_CREATOR is safe.
+    # The tile split depends on the batch, so it travels with the job rather than the pool.
+    try:
+        _DZ_CREATOR.tile_workers = tile_workers
+        return _dz_convert_one(src, outdir, _DZ_CREATOR)
+    except Exception as e:
+        return ("err", src, 0.0, str(e))
 
 def create_deepzoom():
     if not HAS_DEEPZOOM:
@@ -203,88 +369,138 @@ def create_deepzoom():
         messagebox.showerror("Missing input", "Select files and output folder.")
         return
 
-    os.makedirs(output_dir.get(), exist_ok=True)
+    outdir = os.path.abspath(output_dir.get())
+    os.makedirs(outdir, exist_ok=True)
     progress_max.set(len(input_files))
     progress_var.set(0)
 
     prog.config(maximum=len(input_files))
 
-    def worker():
+    workers = _auto_workers(input_files, outdir)
+    # Split the cores between files and tiles so one huge image still uses the whole machine.
+    # Tiles are written straight to the output folder, so keep that serial on a network share.
+    if _is_unc(outdir):
+        tile_workers = 1
+    else:
+        tile_workers = max(1, (os.cpu_count() or 4) // workers)
+
+    def run_parallel():
         t0 = time.perf_counter()
-        creator = _dz_make_creator()
         success = 0
-        for i, src in enumerate(input_files, 1):
+        errors = 0
+        print(f"[DZI] Workers (auto): {workers} file(s) x {tile_workers} tile thread(s)")
+
+        # Tiling is LANCZOS resize + JPEG encode in Python frames, so use processes rather than threads
+        done_count = 0
+        ex = _get_pool("dz", _max_workers(input_files, outdir))
+        futures = {ex.submit(_dz_job, src, outdir, tile_workers): src for src in _largest_first(input_files)}
+        for fut in as_completed(futures):
             try:
-                _, dt = _dz_convert_one(src, output_dir.get(), creator)
-                print(f"[DZI] Created: {_basename_no_ext(src)}.dzi ({dt:.2f}s)")
+                status, src, dt, info = fut.result()
+            except BrokenProcessPool as e:
+                # A worker process died (e.g. out of memory); start a fresh pool next run
+                _drop_pool("dz", ex)
+                status, src, dt, info = ("err", futures[fut], 0.0, repr(e))
+            done_count += 1
+            if status == "ok":
                 success += 1
-            except Exception as e:
-                print(f"[DZI] Error: {src} => {e}")
-            root.after(0, lambda val=i: progress_var.set(val))
+                print(f"[DZI] Created: {os.path.basename(info)} ({dt:.2f}s)")
+            elif status == "skip":
+                errors += 1
+                print(f"[DZI] Skipped missing: {src}")
+            else:
+                errors += 1
+                print(f"[DZI] Error: {src} => {info}")
+            progress_q.put(done_count)
 
         dt_total = time.perf_counter() - t0
-        print(f"[DZI] Done. Created: {success}, Elapsed: {dt_total:.2f}s\n")
-        with open(get_log_file_path(), "w", encoding="utf-8") as f:
-            f.write(log_file_stream.getvalue())
+        print(f"[DZI] Done. Created: {success}, Errors: {errors}, Elapsed: {dt_total:.2f}s\n")
+        root.after(0, _save_log)
         root.after(0, lambda: messagebox.showinfo("DZI creation done", f"Created: {success}, Time: {dt_total:.2f}s"))
 
-    ThreadPoolExecutor(max_workers=1).submit(worker)
+    _UI_EXEC.submit(run_parallel)
 
 
 # === UI ===
-row = 0
-btn_in = tk.Button(root, text="Select Input Image(s)", command=choose_input)
-btn_in.grid(row=row, column=0, padx=8, pady=6, sticky="ew")
-entry_in = tk.Entry(root, textvariable=input_summary, width=70)
-entry_in.grid(row=row, column=1, padx=8, pady=6, sticky="ew")
-row += 1
-
-btn_out = tk.Button(root, text="Choose Output Folder", command=choose_output)
-btn_out.grid(row=row, column=0, padx=8, pady=6, sticky="ew")
-entry_out = tk.Entry(root, textvariable=output_dir, width=70)
-entry_out.grid(row=row, column=1, padx=8, pady=6, sticky="ew")
-row += 1
-
-btn_jpeg = tk.Button(root, text="Save JPEG(s)", command=save_jpeg)
-btn_jpeg.grid(row=row, column=0, padx=8, pady=10, sticky="ew")
-lbl_jpeg_text = tk.Label(root, text="Converts .tif to jpeg, for use with SEM", anchor="w")
-lbl_jpeg_text.grid(row=row, column=1, padx=8, pady=10, sticky="w")
-row += 1
-
-btn_dz = tk.Button(root, text="Create DeepZoom (.dzi) for Selection", command=create_deepzoom)
-btn_dz.grid(row=row, column=0, padx=8, pady=10, sticky="ew")
-lbl_dz_text = tk.Label(root, text="Creates .dzi from a .jpg.", anchor="w")
-lbl_dz_text.grid(row=row, column=1, padx=8, pady=10, sticky="w")
-row += 1
-
-# Progress + elapsed
-ttk.Label(root, text="Progress:").grid(row=row, column=0, sticky="w", padx=8)
-prog = ttk.Progressbar(root, orient="horizontal", mode="determinate",
-                       maximum=progress_max.get(), variable=progress_var, length=400)
-prog.grid(row=row, column=1, sticky="w", padx=8, pady=2)
-def _sync_prog_max(*_):
-    prog.config(maximum=progress_max.get())
-progress_max.trace_add("write", _sync_prog_max)
-elapsed_lbl = ttk.Label(root, textvariable=elapsed_total)
-elapsed_lbl.grid(row=row, column=1, sticky="e", padx=8)
-row += 1
-
-# Console
-tk.Label(root, text="Console Output:").grid(row=row, column=0, columnspan=2, sticky="w", padx=8)
-row += 1
-console_box = scrolledtext.ScrolledText(root, height=16, wrap='word', bg="#111", fg="#ffd700", insertbackground="#0f0")
-console_box.grid(row=row, column=0, columnspan=2, padx=8, pady=6, sticky="nsew")
-sys.stdout = ConsoleRedirect(console_box)
-
-root.columnconfigure(1, weight=1)
-root.rowconfigure(row, weight=1)
-
-###
-redir = ConsoleRedirect(console_box)
-sys.stdout = redir
-redir.suspend_logging = True
-
-print("""
+# Guarded so the DeepZoom worker processes can re-import this module without opening a window
+if __name__ == "__main__":
+    multiprocessing.freeze_support()  # spawned DeepZoom workers in the frozen exe
+
+    root = tk.Tk()
+    root.title("DeepZoom Image Converter")
+    root.geometry("960x640")
+
+    input_files = []
+    input_summary = tk.StringVar()
+    output_dir = tk.StringVar()
+    status_jpeg = tk.StringVar()
+    status_dz = tk.StringVar()
+    elapsed_total = tk.StringVar()
+    progress_var = tk.IntVar()
+    progress_max = tk.IntVar(value=100)
+    small_jpeg = tk.BooleanVar(value=False)
+    reencode_jpeg = tk.BooleanVar(value=False)
+
+    row = 0
+    btn_in = tk.Button(root, text="Select Input Image(s)", command=choose_input)
+    btn_in.grid(row=row, column=0, padx=8, pady=6, sticky="ew")
+    entry_in = tk.Entry(root, textvariable=input_summary, width=70)
+    entry_in.grid(row=row, column=1, padx=8, pady=6, sticky="ew")
+    row += 1
+
+    btn_out = tk.Button(root, text="Choose Output Folder", command=choose_output)
+    btn_out.grid(row=row, column=0, padx=8, pady=6, sticky="ew")
+    entry_out = tk.Entry(root, textvariable=output_dir, width=70)
+    entry_out.grid(row=row, column=1, padx=8, pady=6, sticky="ew")
+    row += 1
+
+    btn_jpeg = tk.Button(root, text="Save JPEG(s)", command=save_jpeg)
+    btn_jpeg.grid(row=row, column=0, padx=8, pady=10, sticky="ew")
+    lbl_jpeg_text = tk.Label(root, text="Converts .tif to jpeg, for use with SEM", anchor="w")
+    lbl_jpeg_text.grid(row=row, column=1, padx=8, pady=10, sticky="w")
+    row += 1
+
+    opts_jpeg = tk.Frame(root)
+    opts_jpeg.grid(row=row, column=1, padx=8, pady=0, sticky="w")
+    chk_small = tk.Checkbutton(opts_jpeg, text="Smaller files (slower)", variable=small_jpeg, anchor="w")
+    chk_small.pack(side="left")
+    chk_reencode = tk.Checkbutton(opts_jpeg, text="Re-encode JPEG inputs", variable=reencode_jpeg, anchor="w")
+    chk_reencode.pack(side="left", padx=(12, 0))
+    row += 1
+
+    btn_dz = tk.Button(root, text="Create DeepZoom (.dzi) for Selection", command=create_deepzoom)
+    btn_dz.grid(row=row, column=0, padx=8, pady=10, sticky="ew")
+    lbl_dz_text = tk.Label(root, text="Creates .dzi from a .jpg.", anchor="w")
+    lbl_dz_text.grid(row=row, column=1, padx=8, pady=10, sticky="w")
+    row += 1
+
+    # Progress + elapsed
+    ttk.Label(root, text="Progress:").grid(row=row, column=0, sticky="w", padx=8)
+    prog = ttk.Progressbar(root, orient="horizontal", mode="determinate",
+                           maximum=progress_max.get(), variable=progress_var, length=400)
+    prog.grid(row=row, column=1, sticky="w", padx=8, pady=2)
+    def _sync_prog_max(*_):
+        prog.config(maximum=progress_max.get())
+    progress_max.trace_add("write", _sync_prog_max)
+    elapsed_lbl = ttk.Label(root, textvariable=elapsed_total)
+    elapsed_lbl.grid(row=row, column=1, sticky="e", padx=8)
+    row += 1
+
+    # Console
+    tk.Label(root, text="Console Output:").grid(row=row, column=0, columnspan=2, sticky="w", padx=8)
+    row += 1
+    console_box = scrolledtext.ScrolledText(root, height=16, wrap='word', bg="#111", fg="#ffd700", insertbackground="#0f0")
+    console_box.grid(row=row, column=0, columnspan=2, padx=8, pady=6, sticky="nsew")
+
+    root.columnconfigure(1, weight=1)
+    root.rowconfigure(row, weight=1)
+
+    ###
+    redir = ConsoleRedirect(console_box)
+    sys.stdout = redir
+    redir.suspend_logging = True
+
+    print("""
 
 
 Welcome to the DeepZoom Image Converter. 
@@ -307,5 +523,10 @@ eoleson (at) uark (dot) edu.
                                                                                                                 
 === DeepZoom Converter Ready ===
 """)
-redir.suspend_logging = False
-root.mainloop()
\ No newline at end of file
+    redir.suspend_logging = False
+    _print_codec_info()
+    _pump_ui()
+    root.mainloop()
+    # Window closed: drop queued files now. atexit would be too late, since the interpreter
+    # joins executor threads (finishing every queued job) before atexit callbacks run.
+    _shutdown_pools()
\ No newline at end of file
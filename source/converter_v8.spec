@@ -6,7 +6,7 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[],
-    hiddenimports=['pandas', 'openpyxl'],
+    hiddenimports=['pandas', 'openpyxl', 'kernels', 'numba'],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,93 @@
+### Vendored deepzoom.ImageCreator with tiles saved in parallel
+
+import os
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from PIL import Image
+from deepzoom import ImageCreator, DeepZoomImageDescriptor
+
+# Tiles are encoded straight through libjpeg-turbo when available, PIL otherwise
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJPF_GRAY, TJSAMP_420, TJSAMP_GRAY
+    _TJ = TurboJPEG()
+except Exception:
+    _TJ = None
+
+# deepzoom's filter names; anything else falls back to LANCZOS exactly like ImageCreator.get_image
+_RESIZE_FILTERS = {
+    "cubic": Image.BICUBIC,
+    "bilinear": Image.BILINEAR,
+    "bicubic": Image.BICUBIC,
+    "nearest": Image.NEAREST,
+    "antialias": Image.LANCZOS,
+}
+
+
+class FastImageCreator(ImageCreator):
+    """Same output layout as deepzoom.ImageCreator, but each level is halved from
+    the level above it instead of re-resizing the full-resolution source, and the
+    tiles within a level are cropped/encoded on a thread pool.
+
+    create() takes a filesystem path (or an already decoded PIL image, or a
+    callable returning either) rather than a file:// URI: the source is opened
+    and decoded exactly once, without deepzoom's in-memory copy of the file.
+    Pass a callable when the caller must not keep the full-resolution image
+    referenced while the pyramid is built."""
+
+    def __init__(self, *args, tile_workers=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tile_workers = tile_workers or os.cpu_count() or 4
+        self._jpeg_quality = int(self.image_quality * 100)
+
+    def _save_tile(self, level_image, level_dir, level, column, row):
+        bounds = self.descriptor.get_tile_bounds(level, column, row)
+        tile = level_image.crop(bounds)
+        tile_path = os.path.join(level_dir, f"{column}_{row}.{self.descriptor.tile_format}")
+        if self.descriptor.tile_format != "jpg":
+            tile.save(tile_path)
+        elif _TJ is not None and tile.mode in ("RGB", "L"):
+            # Same quality and 4:2:0 sampling PIL uses by default, minus PIL's per-tile save setup
+            if tile.mode == "L":
+                pixels, pixel_format, subsample = np.asarray(tile)[:, :, None], TJPF_GRAY, TJSAMP_GRAY
+            else:
+                pixels, pixel_format, subsample = np.asarray(tile), TJPF_RGB, TJSAMP_420
+            data = _TJ.encode(pixels, quality=self._jpeg_quality,
+                              pixel_format=pixel_format, jpeg_subsample=subsample)
+            with open(tile_path, "wb") as f:
+                f.write(data)
+        else:
+            tile.save(tile_path, "JPEG", quality=self._jpeg_quality)
+
+    def create(self, source, destination):
+        if callable(source):
+            source = source()
+        self.image = source if isinstance(source, Image.Image) else Image.open(source)
+        del source  # self.image holds the only reference from here on
+        # Decode once, up front: every level derives from this, and the tile threads
+        # crop concurrently so they must not race on a lazy load()
+        self.image.load()
+        width, height = self.image.size
+        self.descriptor = DeepZoomImageDescriptor(width=width, height=height,
+                                                  tile_size=self.tile_size,
+                                                  tile_overlap=self.tile_overlap,
+                                                  tile_format=self.tile_format)
+
+        resample = _RESIZE_FILTERS.get(self.resize_filter, Image.LANCZOS)
+        image_files = os.path.splitext(destination)[0] + "_files"
+        # Only the current level stays referenced; the source is freed once the next level exists
+        level_image, self.image = self.image, None
+        with ThreadPoolExecutor(max_workers=self.tile_workers) as ex:
+            # Top level first; every smaller level is a 2x downsample of the previous one,
+            # so the total resize work is ~1.33x the source instead of num_levels x
+            for level in range(self.descriptor.num_levels - 1, -1, -1):
+                size = self.descriptor.get_dimensions(level)
+                if level_image.size != size:
+                    level_image = level_image.resize(size, resample)
+                level_dir = os.path.join(image_files, str(level))
+                os.makedirs(level_dir, exist_ok=True)
+                save = partial(self._save_tile, level_image, level_dir, level)
+                # Drain the level before moving on; re-raises the first tile error
+                list(ex.map(lambda cr: save(*cr), self.tiles(level)))
+
+        self.descriptor.save(destination)
@@ -0,0 +1,29 @@
+### Numba kernels for the per-pixel hot loops (optional; numpy fallbacks live in the converter)
+
+import sys
+import numpy as np
+from numba import njit
+
+# The frozen exe has no .py next to this module, so numba has nowhere to key an on-disk cache;
+# there the kernel is compiled on first use in each process instead
+_CACHE = not getattr(sys, "frozen", False)
+
+
+# Serial on purpose: callers already run one file per core, and a prange here would
+# oversubscribe them (and is not thread-safe on numba's fallback workqueue layer).
+# nogil lets those JPEG pool threads composite at the same time, as the numpy path does.
+@njit(nogil=True, cache=_CACHE, boundscheck=False)
+def alpha_over_white(src, out):
+    """Composite an (H, W, 2|4) uint8 LA/RGBA array onto white into out (H, W, 3) uint8.
+
+    Same rounding as the numpy path: (c*a + 255*(255-a) + 127) // 255.
+    The inner loops vectorize."""
+    h, w, n = src.shape
+    last = n - 1  # alpha is the last channel; LA has one color channel, RGBA three
+    for y in range(h):
+        for x in range(w):
+            a = np.int32(src[y, x, last])
+            bg = 255 * (255 - a) + 127
+            for c in range(3):
+                v = np.int32(src[y, x, c if last == 3 else 0])
+                out[y, x, c] = np.uint8((v * a + bg) // 255)
@@ -0,0 +1,11 @@
+# Compiles converter_core.py to a native extension with mypyc:
+#   python setup.py build_ext --inplace
+# Run it from this folder before pyinstaller; the compiled module is picked up in place of
+# converter_core.py. Without it the converters fall back to the pure-Python source.
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name="converter_core",
+    ext_modules=mypycify(["--ignore-missing-imports", "converter_core.py"]),
+)